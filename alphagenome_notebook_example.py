@@ -5,13 +5,71 @@ Based on the Quick Start Guide and Essential Commands from the documentation.
 This mimics the structure of the Google Colab notebooks.
 """
 
+import bisect
+import collections
+import functools
+import gc
 import os
 import sys
+import threading
+import timeit
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
+import numpy as np
+
 # Import our environment loader helper
 from load_env_helper import get_api_key
+from client_helper import LazyModules, get_model
+from stats_helper import NUMBA_AVAILABLE, fused_difference_stats, fused_summary_stats
+
+# Sequence lengths accepted by the AlphaGenome model, in ascending order
+SUPPORTED_LENGTHS = (2048, 16384, 131072, 524288, 1048576)
+
+# Tissue used throughout the examples (liver)
+LIVER_ONTOLOGY_TERMS = ('UBERON:0001157',)
+
+@functools.lru_cache(maxsize=None)
+def output_types(dna_client, *names):
+    """Resolve OutputType names to a reusable tuple of enum members"""
+    return tuple(getattr(dna_client.OutputType, name) for name in names)
+
+# Recent predictions keyed by their request parameters, so re-running a cell
+# with the same interval/variant skips the API call
+_PREDICTION_CACHE = collections.OrderedDict()
+_PREDICTION_CACHE_SIZE = 128
+_PREDICTION_CACHE_LOCK = threading.Lock()
+
+def _cache_get(key):
+    """Return a cached prediction (or None) and mark it as recently used"""
+    with _PREDICTION_CACHE_LOCK:
+        outputs = _PREDICTION_CACHE.get(key)
+        if outputs is not None:
+            _PREDICTION_CACHE.move_to_end(key)
+        return outputs
+
+def _cache_put(key, outputs):
+    """Store a prediction, evicting the least recently used entry when full"""
+    with _PREDICTION_CACHE_LOCK:
+        _PREDICTION_CACHE[key] = outputs
+        _PREDICTION_CACHE.move_to_end(key)
+        if len(_PREDICTION_CACHE) > _PREDICTION_CACHE_SIZE:
+            _PREDICTION_CACHE.popitem(last=False)
+
+def clear_prediction_cache():
+    """Drop all cached predictions so their arrays can be freed"""
+    with _PREDICTION_CACHE_LOCK:
+        _PREDICTION_CACHE.clear()
+
+def snap_to_supported_length(length):
+    """Return the smallest supported sequence length >= length (capped at 1MB)"""
+    index = bisect.bisect_left(SUPPORTED_LENGTHS, length)
+    return SUPPORTED_LENGTHS[min(index, len(SUPPORTED_LENGTHS) - 1)]
+
+def emit(lines):
+    """Write a block of report lines to stdout in one call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 def install_check():
     """Check AlphaGenome installation - mimics the @title Install AlphaGenome cell"""
@@ -34,31 +92,16 @@ def imports_cell():
     print("=" * 40)
     
     try:
-        # Essential imports from the quick start guide
-        from alphagenome.data import gene_annotation
-        from alphagenome.data import genome
-        from alphagenome.data import transcript as transcript_utils
-        from alphagenome.interpretation import ism
-        from alphagenome.models import dna_client
-        from alphagenome.models import variant_scorers
-        from alphagenome.visualization import plot_components
-        import matplotlib.pyplot as plt
-        import pandas as pd
+        # Every cell needs genome and dna_client; scorers, ISM and plotting
+        # modules are only imported by the cells that use them
+        modules = LazyModules()
+        modules['genome']
+        modules['dna_client']
         
         print("✅ Core AlphaGenome modules imported")
-        print("✅ Visualization and analysis tools imported")
-        
-        return {
-            'gene_annotation': gene_annotation,
-            'genome': genome,
-            'transcript_utils': transcript_utils,
-            'ism': ism,
-            'dna_client': dna_client,
-            'variant_scorers': variant_scorers,
-            'plot_components': plot_components,
-            'plt': plt,
-            'pd': pd
-        }
+        print("✅ Visualization and analysis tools available on demand")
+        
+        return modules
     except ImportError as e:
         print(f"❌ Import error: {e}")
         return None
@@ -77,8 +120,8 @@ def setup_client(modules):
         return None
     
     try:
-        # Create the DNA client
-        model = modules['dna_client'].create(api_key)
+        # Create the DNA client (cached, so re-running the cell skips the handshake)
+        model = get_model(api_key)
         print("✅ AlphaGenome client created successfully")
         print("🌐 Connected to Google DeepMind's AlphaGenome API")
         return model
@@ -116,8 +159,7 @@ def genomic_basics_example(modules, model):
         
         # Show supported sequence lengths
         print("\n📋 AlphaGenome supported sequence lengths:")
-        supported_lengths = [2048, 16384, 131072, 524288, 1048576]
-        for length in supported_lengths:
+        for length in SUPPORTED_LENGTHS:
             kb = length // 1024
             if kb >= 1024:
                 size_str = f"{kb//1024}MB"
@@ -129,7 +171,7 @@ def genomic_basics_example(modules, model):
         print(f"\n🔧 Interval operations:")
         
         # Resize to nearest supported length
-        resized = small_interval.resize(2048)
+        resized = small_interval.resize(snap_to_supported_length(small_interval.end - small_interval.start))
         print(f"📐 Resized interval: {resized}")
         print(f"📏 New size: {resized.end - resized.start:,} bp")
         
@@ -195,8 +237,127 @@ def variant_definition_example(modules):
         print(f"❌ Error in variant definition: {e}")
         return None, None, None
 
-def basic_prediction_example(modules, model, interval):
-    """Basic prediction example"""
+# Set by calibrate_effect_stats() on first use; the kernels are only used where
+# they beat NumPy
+_USE_NUMBA = None
+
+def _use_numba():
+    """Whether to use the Numba kernels, calibrating on the first call"""
+    if _USE_NUMBA is None:
+        calibrate_effect_stats()
+    return _USE_NUMBA
+
+def _summary_stats_numpy(values, overwrite=False):
+    """NumPy implementation of summary_stats; overwrite=True lets it use values as scratch"""
+    data = np.asarray(values, dtype=np.float32).ravel()
+    # float64 accumulators are chunked by NumPy, so no float64 copy of data is made
+    mean = data.mean(dtype=np.float64)
+    low = data.min()
+    high = data.max()
+    if overwrite:
+        # The caller owns the buffer: centre and square it in place, no temporary
+        np.subtract(data, mean, out=data, casting='unsafe')
+        np.square(data, out=data)
+        variance = data.mean(dtype=np.float64)
+    else:
+        # E[x^2] - mean^2 with a float64 accumulator instead of a centred copy
+        sum_sq = np.einsum('i,i->', data, data, dtype=np.float64)
+        variance = max(sum_sq / data.size - mean * mean, 0.0)
+    return {
+        'mean': mean,
+        'std': np.sqrt(variance),
+        'min': low,
+        'max': high
+    }
+
+def summary_stats(values):
+    """Compute mean/std/min/max of a prediction array"""
+    if _use_numba():
+        # One fused pass instead of separate min, max, mean and variance passes
+        mean, std, low, high = fused_summary_stats(values)
+        return {'mean': mean, 'std': std, 'min': low, 'max': high}
+    return _summary_stats_numpy(values)
+
+# Reusable float32 difference buffers keyed by shape (most recent last)
+_SCRATCH = collections.OrderedDict()
+_SCRATCH_SIZE = 4
+
+def _scratch_buffer(shape):
+    """Return a persistent float32 buffer of the given shape"""
+    buffer = _SCRATCH.pop(shape, None)
+    if buffer is None:
+        buffer = np.empty(shape, dtype=np.float32)
+        if len(_SCRATCH) >= _SCRATCH_SIZE:
+            _SCRATCH.popitem(last=False)
+    _SCRATCH[shape] = buffer
+    return buffer
+
+def _effect_stats_numpy(ref_data, alt_data):
+    """NumPy implementation of effect_stats"""
+    # Batches of same-sized windows reuse one buffer instead of allocating per variant
+    diff = np.subtract(alt_data, ref_data, out=_scratch_buffer(np.shape(ref_data)))
+    # The scratch buffer is ours, so the statistics may overwrite it
+    diff_stats = _summary_stats_numpy(diff, overwrite=True)
+    # max |d| follows from the extremes already computed; no abs() temporary needed
+    max_abs = max(-diff_stats['min'], diff_stats['max'])
+    return diff_stats['mean'], diff_stats['std'], max_abs
+
+def effect_stats(ref_data, alt_data):
+    """Return (mean, std, max_abs) of the ALT - REF difference"""
+    if _use_numba():
+        # The kernel never materializes the difference array
+        diff_mean, diff_std, diff_min, diff_max = fused_difference_stats(ref_data, alt_data)
+        return diff_mean, diff_std, max(-diff_min, diff_max)
+    return _effect_stats_numpy(ref_data, alt_data)
+
+def calibrate_effect_stats():
+    """Time both statistics backends once on 1MB of float32 and keep the faster one"""
+    global _USE_NUMBA
+    _USE_NUMBA = False
+    if not NUMBA_AVAILABLE:
+        return False
+    
+    try:
+        ref = np.random.default_rng(0).random(262144, dtype=np.float32)
+        alt = ref + np.float32(0.01)
+        fused_difference_stats(ref, alt)  # start Numba's thread pool outside the timing
+        numba_time = min(timeit.repeat(lambda: fused_difference_stats(ref, alt), number=5, repeat=3))
+        numpy_time = min(timeit.repeat(lambda: _effect_stats_numpy(ref, alt), number=5, repeat=3))
+    except Exception as e:
+        print(f"⚠️ Numba statistics unavailable, using NumPy: {e}")
+        return False
+    _USE_NUMBA = numba_time < numpy_time
+    return _USE_NUMBA
+
+def top_k_scores(raw_score, k):
+    """Return the k largest (track, score) pairs without sorting every track"""
+    scores = raw_score.to_numpy()
+    k = min(k, scores.size)
+    if k == 0:
+        return []
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    return [(raw_score.index[i], scores[i]) for i in top]
+
+def predict_interval(modules, model, interval):
+    """Predict RNA-seq and ATAC-seq tracks for an interval"""
+    ontology_terms = LIVER_ONTOLOGY_TERMS
+    requested_outputs = output_types(modules['dna_client'], 'RNA_SEQ', 'ATAC_SEQ')
+    key = ('interval', interval.chromosome, interval.start, interval.end,
+           ontology_terms, requested_outputs)
+    
+    outputs = _cache_get(key)
+    if outputs is None:
+        outputs = model.predict(
+            interval=interval,
+            ontology_terms=ontology_terms,
+            requested_outputs=requested_outputs,
+        )
+        _cache_put(key, outputs)
+    return outputs
+
+def basic_prediction_example(modules, model, interval, pending=None):
+    """Basic prediction example (pending: optional future already fetching the outputs)"""
     print("\n🔮 Basic Prediction Example")
     print("=" * 40)
     
@@ -211,14 +372,10 @@ def basic_prediction_example(modules, model, interval):
         # Make predictions for multiple output types
         print("⏱️ This may take a moment...")
         
-        outputs = model.predict(
-            interval=interval,
-            ontology_terms=['UBERON:0001157'],  # liver tissue
-            requested_outputs=[
-                modules['dna_client'].OutputType.RNA_SEQ,
-                modules['dna_client'].OutputType.ATAC_SEQ,
-            ],
-        )
+        if pending is not None:
+            outputs = pending.result()
+        else:
+            outputs = predict_interval(modules, model, interval)
         
         print("✅ Predictions completed!")
         
@@ -228,19 +385,8 @@ def basic_prediction_example(modules, model, interval):
         print(f"🧬 ATAC-seq data shape: {outputs.atac_seq.values.shape}")
         
         # Basic statistics
-        rna_stats = {
-            'mean': outputs.rna_seq.values.mean(),
-            'std': outputs.rna_seq.values.std(),
-            'min': outputs.rna_seq.values.min(),
-            'max': outputs.rna_seq.values.max()
-        }
-        
-        atac_stats = {
-            'mean': outputs.atac_seq.values.mean(),
-            'std': outputs.atac_seq.values.std(),
-            'min': outputs.atac_seq.values.min(),
-            'max': outputs.atac_seq.values.max()
-        }
+        rna_stats = summary_stats(outputs.rna_seq.values)
+        atac_stats = summary_stats(outputs.atac_seq.values)
         
         print(f"\n📈 RNA-seq Statistics:")
         for stat, value in rna_stats.items():
@@ -261,71 +407,120 @@ def basic_prediction_example(modules, model, interval):
         print(f"❌ Prediction error: {e}")
         return None
 
-def variant_prediction_example(modules, model, variant):
-    """Variant effect prediction example"""
+def _variant_interval(modules, variant):
+    """Build the 16KB analysis window centred on a variant"""
+    interval = modules['genome'].Interval(
+        chromosome=variant.chromosome,
+        start=variant.position - 8192,  # 8KB upstream
+        end=variant.position + 8192     # 8KB downstream
+    )
+    return interval.resize(snap_to_supported_length(interval.end - interval.start))
+
+def predict_variants_batch(modules, model, variants, max_workers=16):
+    """Predict several variants with as few API round-trips as possible"""
+    intervals = [_variant_interval(modules, variant) for variant in variants]
+    request = {
+        'ontology_terms': LIVER_ONTOLOGY_TERMS,
+        'requested_outputs': output_types(modules['dna_client'], 'RNA_SEQ'),
+    }
+    
+    keys = [
+        ('variant', variant.chromosome, variant.position, variant.reference_bases,
+         variant.alternate_bases, interval.start, interval.end,
+         request['ontology_terms'], request['requested_outputs'])
+        for variant, interval in zip(variants, intervals)
+    ]
+    results = [_cache_get(key) for key in keys]
+    missing = [i for i, outputs in enumerate(results) if outputs is None]
+    if not missing:
+        return results
+    
+    missing_intervals = [intervals[i] for i in missing]
+    missing_variants = [variants[i] for i in missing]
+    
+    # Prefer the client's batch endpoint; otherwise overlap the I/O-bound calls
+    if hasattr(model, 'predict_variants'):
+        fetched = list(model.predict_variants(intervals=missing_intervals, variants=missing_variants, **request))
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+            fetched = list(executor.map(
+                lambda pair: model.predict_variant(interval=pair[0], variant=pair[1], **request),
+                zip(missing_intervals, missing_variants),
+            ))
+    
+    for i, outputs in zip(missing, fetched):
+        _cache_put(keys[i], outputs)
+        results[i] = outputs
+    return results
+
+def variant_prediction_example(modules, model, variants, pending=None):
+    """Variant effect prediction example (pending: optional future already fetching the outputs)"""
     print("\n🎯 Variant Effect Prediction Example")
     print("=" * 40)
     
-    if not model or not variant:
-        print("❌ Skipping: model or variant not available")
+    variants = [variant for variant in variants if variant]
+    if not model or not variants:
+        print("❌ Skipping: model or variants not available")
         return None
     
     try:
-        print("🧪 Making variant effect predictions...")
-        print(f"🔬 Variant: {variant}")
-        
-        # Create a suitable interval around the variant
-        interval = modules['genome'].Interval(
-            chromosome=variant.chromosome,
-            start=variant.position - 8192,  # 8KB upstream
-            end=variant.position + 8192     # 8KB downstream
-        ).resize(16384)  # Resize to nearest supported length
-        
-        print(f"📍 Analysis region: {interval}")
-        print(f"📏 Region size: {interval.end - interval.start:,} bp")
-        
+        print(f"🧪 Making variant effect predictions for {len(variants)} variant(s)...")
         print("⏱️ This may take a moment...")
         
-        # Make variant predictions
-        outputs = model.predict_variant(
-            interval=interval,
-            variant=variant,
-            ontology_terms=['UBERON:0001157'],  # liver tissue
-            requested_outputs=[modules['dna_client'].OutputType.RNA_SEQ],
-        )
+        # Make variant predictions in a single batch
+        if pending is not None:
+            batch_outputs = pending.result()
+        else:
+            batch_outputs = predict_variants_batch(modules, model, variants)
         
         print("✅ Variant predictions completed!")
         
-        # Analyze the results
-        print(f"\n📊 Variant Effect Analysis:")
-        print(f"🧬 Reference RNA-seq shape: {outputs.reference.rna_seq.values.shape}")
-        print(f"🧬 Alternate RNA-seq shape: {outputs.alternate.rna_seq.values.shape}")
-        
-        # Calculate differences
-        ref_data = outputs.reference.rna_seq.values
-        alt_data = outputs.alternate.rna_seq.values
-        diff = alt_data - ref_data
-        
-        print(f"\n📈 Effect Statistics:")
-        print(f"Reference mean: {ref_data.mean():.6f}")
-        print(f"Alternate mean: {alt_data.mean():.6f}")
-        print(f"Mean difference: {diff.mean():.6f}")
-        print(f"Max absolute difference: {abs(diff).max():.6f}")
-        print(f"Standard deviation of difference: {diff.std():.6f}")
-        
-        # Interpretation
-        if abs(diff.mean()) > 0.001:
-            effect = "increases" if diff.mean() > 0 else "decreases"
-            print(f"🎯 The variant {effect} RNA expression on average")
-        else:
-            print("🎯 The variant has minimal average effect on RNA expression")
-        
-        return outputs
+        for variant, outputs in zip(variants, batch_outputs):
+            interval = outputs.reference.rna_seq.interval
+            
+            # Calculate differences
+            ref_data = outputs.reference.rna_seq.values
+            alt_data = outputs.alternate.rna_seq.values
+            diff_mean, diff_std, diff_max_abs = effect_stats(ref_data, alt_data)
+            
+            # Interpretation
+            if abs(diff_mean) > 0.001:
+                effect = "increases" if diff_mean > 0 else "decreases"
+                interpretation = f"🎯 The variant {effect} RNA expression on average"
+            else:
+                interpretation = "🎯 The variant has minimal average effect on RNA expression"
+            
+            # Emit the whole per-variant report with a single write
+            emit([
+                f"\n🔬 Variant: {variant}",
+                f"📍 Analysis region: {interval}",
+                f"📏 Region size: {interval.end - interval.start:,} bp",
+                f"\n📊 Variant Effect Analysis:",
+                f"🧬 Reference RNA-seq shape: {ref_data.shape}",
+                f"🧬 Alternate RNA-seq shape: {alt_data.shape}",
+                f"\n📈 Effect Statistics:",
+                f"Reference mean: {ref_data.mean(dtype=np.float32):.6f}",
+                f"Alternate mean: {alt_data.mean(dtype=np.float32):.6f}",
+                f"Mean difference: {diff_mean:.6f}",
+                f"Max absolute difference: {diff_max_abs:.6f}",
+                f"Standard deviation of difference: {diff_std:.6f}",
+                interpretation,
+            ])
+        
+        return batch_outputs
         
     except Exception as e:
         print(f"❌ Variant prediction error: {e}")
         return None
 
+@functools.lru_cache(maxsize=1)
+def get_scorers(variant_scorers):
+    """Build the (name, scorer) pairs once and reuse them for every batch"""
+    return (
+        ('Gene Expression', variant_scorers.GeneExpressionScorer()),
+        # Add more scorers as available
+    )
+
 def variant_scoring_example(modules, model, variant_outputs):
     """Variant scoring example"""
     print("\n⚖️ Variant Scoring Example")
@@ -336,32 +531,28 @@ def variant_scoring_example(modules, model, variant_outputs):
         return None
     
     try:
-        print("🔢 Computing variant effect scores...")
-        
-        # Initialize different scorers
-        scorers = {
-            'Gene Expression': modules['variant_scorers'].GeneExpressionScorer(),
-            # Add more scorers as available
-        }
+        print(f"🔢 Computing variant effect scores for {len(variant_outputs)} variant(s)...")
         
         results = {}
         
-        for scorer_name, scorer in scorers.items():
+        for scorer_name, scorer in get_scorers(modules['variant_scorers']):
             print(f"📊 Running {scorer_name} scorer...")
             try:
-                scores = scorer.score(variant_outputs)
-                results[scorer_name] = scores
+                # Score the whole batch with one scorer instance
+                batch_scores = [scorer.score(outputs) for outputs in variant_outputs]
+                results[scorer_name] = batch_scores
                 
-                print(f"✅ {scorer_name} scoring completed")
-                print(f"  📈 Number of scores: {len(scores.raw_score)}")
-                print(f"  📈 Score range: {scores.raw_score.min():.6f} to {scores.raw_score.max():.6f}")
-                
-                # Show top scores
-                if len(scores.raw_score) > 0:
-                    top_scores = scores.raw_score.nlargest(3)
-                    print(f"  🏆 Top 3 scores:")
-                    for idx, score in top_scores.items():
-                        print(f"    Track {idx}: {score:.6f}")
+                lines = [f"✅ {scorer_name} scoring completed"]
+                for scores in batch_scores:
+                    lines.append(f"  📈 Number of scores: {len(scores.raw_score)}")
+                    lines.append(f"  📈 Score range: {scores.raw_score.min():.6f} to {scores.raw_score.max():.6f}")
+                    
+                    # Show top scores
+                    if len(scores.raw_score) > 0:
+                        lines.append(f"  🏆 Top 3 scores:")
+                        for idx, score in top_k_scores(scores.raw_score, 3):
+                            lines.append(f"    Track {idx}: {score:.6f}")
+                emit(lines)
                 
             except Exception as e:
                 print(f"⚠️ {scorer_name} scoring failed: {e}")
@@ -384,8 +575,10 @@ def visualization_example(modules, outputs, variant=None):
     try:
         print("🎨 Creating visualizations...")
         
+        import matplotlib.pyplot as plt
+        
         # Set up matplotlib for saving
-        modules['plt'].ioff()  # Turn off interactive mode
+        plt.ioff()  # Turn off interactive mode
         
         if hasattr(outputs, 'reference') and hasattr(outputs, 'alternate'):
             # Variant comparison plot
@@ -405,8 +598,8 @@ def visualization_example(modules, outputs, variant=None):
                 annotations=[modules['plot_components'].VariantAnnotation([variant], alpha=0.8)] if variant else [],
             )
             
-            modules['plt'].title('AlphaGenome Variant Effect Prediction\nRNA-seq in Liver Tissue')
-            modules['plt'].savefig('variant_effect.png', dpi=150, bbox_inches='tight')
+            plt.title('AlphaGenome Variant Effect Prediction\nRNA-seq in Liver Tissue')
+            plt.savefig('variant_effect.png', dpi=150, bbox_inches='tight')
             print("💾 Variant effect plot saved as 'variant_effect.png'")
             
         elif hasattr(outputs, 'rna_seq'):
@@ -420,11 +613,11 @@ def visualization_example(modules, outputs, variant=None):
                 interval=outputs.rna_seq.interval,
             )
             
-            modules['plt'].title('AlphaGenome Genomic Prediction\nRNA-seq in Liver Tissue')
-            modules['plt'].savefig('genomic_prediction.png', dpi=150, bbox_inches='tight')
+            plt.title('AlphaGenome Genomic Prediction\nRNA-seq in Liver Tissue')
+            plt.savefig('genomic_prediction.png', dpi=150, bbox_inches='tight')
             print("💾 Genomic prediction plot saved as 'genomic_prediction.png'")
         
-        modules['plt'].close('all')  # Clean up
+        plt.close('all')  # Clean up
         print("✅ Visualizations completed")
         return True
         
@@ -461,20 +654,34 @@ def main():
     snp, insertion, deletion = variant_definition_example(modules)
     
     if model:
-        # Cell 6: Basic prediction
-        basic_outputs = basic_prediction_example(modules, model, small_interval)
+        # Cells 6 and 7 are network-bound: start both API calls up front so they overlap
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            basic_pending = executor.submit(predict_interval, modules, model, small_interval) if small_interval else None
+            variant_pending = executor.submit(predict_variants_batch, modules, model, [snp]) if snp else None
+            
+            # Cell 6: Basic prediction
+            basic_outputs = basic_prediction_example(modules, model, small_interval, basic_pending)
+            
+            # Cell 7: Variant prediction (batched)
+            variant_outputs = variant_prediction_example(modules, model, [snp], variant_pending)
         
-        # Cell 7: Variant prediction
-        variant_outputs = variant_prediction_example(modules, model, snp)
+        # Cell 8: Variant scoring (scores are printed, not kept)
+        variant_scoring_example(modules, model, variant_outputs)
         
-        # Cell 8: Variant scoring
-        scoring_results = variant_scoring_example(modules, model, variant_outputs)
+        # This run will not ask for the same predictions again, so only the
+        # outputs that get plotted need to stay alive from here on
+        clear_prediction_cache()
+        if variant_outputs:
+            plot_outputs, plot_variant = variant_outputs[0], snp
+        else:
+            plot_outputs, plot_variant = basic_outputs, None
+        del basic_outputs, variant_outputs
+        gc.collect()
         
         # Cell 9: Visualization
-        if variant_outputs:
-            visualization_example(modules, variant_outputs, snp)
-        elif basic_outputs:
-            visualization_example(modules, basic_outputs)
+        if plot_outputs:
+            visualization_example(modules, plot_outputs, plot_variant)
+        del plot_outputs
     
     print("\n🎉 Notebook example completed!")
     print("\n📚 What was demonstrated:")
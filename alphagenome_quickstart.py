@@ -5,11 +5,51 @@ Based on the official AlphaGenome documentation and GitHub repository examples.
 This demonstrates the main functionality of the AlphaGenome API.
 """
 
+import functools
 import os
 import sys
 
 # Import our environment loader helper
 from load_env_helper import get_api_key
+from client_helper import ALPHAGENOME_MODULES, LazyModules, get_model
+
+# Modules exposed by import_dependencies(), imported on first lookup
+_MODULE_PATHS = {
+    **ALPHAGENOME_MODULES,
+    'plt': 'matplotlib.pyplot',
+    'pd': 'pandas',
+}
+
+# Tissue used by every example (liver)
+LIVER_ONTOLOGY_TERMS = ('UBERON:0001157',)
+
+# Each entry holds full REF/ALT outputs for up to 1 Mb, so keep only the
+# predictions the examples in one run actually share
+@functools.lru_cache(maxsize=2)
+def _predict_variant_cached(api_key, interval_key, variant_key, output_names):
+    """Run one variant prediction per (interval, variant, outputs) combination"""
+    from alphagenome.data import genome
+    from alphagenome.models import dna_client
+    chromosome, start, end = interval_key
+    variant_chromosome, position, reference_bases, alternate_bases = variant_key
+    return get_model(api_key).predict_variant(
+        interval=genome.Interval(chromosome=chromosome, start=start, end=end),
+        variant=genome.Variant(
+            chromosome=variant_chromosome,
+            position=position,
+            reference_bases=reference_bases,
+            alternate_bases=alternate_bases,
+        ),
+        ontology_terms=list(LIVER_ONTOLOGY_TERMS),
+        requested_outputs=[dna_client.OutputType[name] for name in output_names],
+    )
+
+def predict_variant(api_key, interval, variant, *output_names):
+    """Predict a variant's effect in liver, reusing results for repeated calls"""
+    interval_key = (interval.chromosome, interval.start, interval.end)
+    variant_key = (variant.chromosome, variant.position,
+                   variant.reference_bases, variant.alternate_bases)
+    return _predict_variant_cached(api_key, interval_key, variant_key, output_names)
 
 def check_setup():
     """Check if the environment is properly set up"""
@@ -27,29 +67,18 @@ def import_dependencies():
     try:
         print("📦 Importing AlphaGenome modules...")
         
-        # Core imports from the quick start guide
-        from alphagenome.data import gene_annotation
-        from alphagenome.data import genome
-        from alphagenome.data import transcript as transcript_utils
-        from alphagenome.interpretation import ism
-        from alphagenome.models import dna_client
-        from alphagenome.models import variant_scorers
-        from alphagenome.visualization import plot_components
-        import matplotlib.pyplot as plt
-        import pandas as pd
+        # Plots are only saved to files, so use the non-interactive backend
+        # whenever matplotlib ends up being imported
+        os.environ.setdefault('MPLBACKEND', 'Agg')
+        
+        # Every example needs genome and dna_client; scorers and plotting
+        # modules are only imported by the examples that use them
+        modules = LazyModules(_MODULE_PATHS)
+        modules['genome']
+        modules['dna_client']
         
         print("✅ All imports successful")
-        return {
-            'gene_annotation': gene_annotation,
-            'genome': genome,
-            'transcript_utils': transcript_utils,
-            'ism': ism,
-            'dna_client': dna_client,
-            'variant_scorers': variant_scorers,
-            'plot_components': plot_components,
-            'plt': plt,
-            'pd': pd
-        }
+        return modules
     except ImportError as e:
         print(f"❌ Import error: {e}")
         print("Make sure AlphaGenome is installed: pip install -U alphagenome")
@@ -66,7 +95,6 @@ def variant_prediction_example(modules):
     try:
         # Get API key and create client
         API_KEY = get_api_key()
-        model = modules['dna_client'].create(API_KEY)
         
         print("🔬 Creating genomic interval and variant...")
         
@@ -93,12 +121,7 @@ def variant_prediction_example(modules):
         print("This may take a moment...")
         
         # Make variant predictions for RNA-seq output
-        outputs = model.predict_variant(
-            interval=interval,
-            variant=variant,
-            ontology_terms=['UBERON:0001157'],  # liver tissue
-            requested_outputs=[modules['dna_client'].OutputType.RNA_SEQ],
-        )
+        outputs = predict_variant(API_KEY, interval, variant, 'RNA_SEQ')
         
         print("✅ Prediction completed!")
         print(f"📊 Reference RNA-seq data shape: {outputs.reference.rna_seq.values.shape}")
@@ -124,6 +147,7 @@ def variant_prediction_example(modules):
             
             # Save the plot
             modules['plt'].savefig('variant_prediction.png', dpi=150, bbox_inches='tight')
+            modules['plt'].close('all')
             print("💾 Plot saved as 'variant_prediction.png'")
         except Exception as e:
             print(f"⚠️ Visualization error (this is normal in headless environments): {e}")
@@ -143,7 +167,7 @@ def basic_interval_prediction(modules):
     
     try:
         API_KEY = get_api_key()
-        model = modules['dna_client'].create(API_KEY)
+        model = get_model(API_KEY)
         
         print("🔬 Creating a smaller genomic interval...")
         
@@ -162,7 +186,7 @@ def basic_interval_prediction(modules):
         # Make predictions for multiple output types
         outputs = model.predict(
             interval=interval,
-            ontology_terms=['UBERON:0001157'],  # liver tissue
+            ontology_terms=list(LIVER_ONTOLOGY_TERMS),
             requested_outputs=[
                 modules['dna_client'].OutputType.RNA_SEQ,
                 modules['dna_client'].OutputType.ATAC_SEQ,
@@ -195,7 +219,6 @@ def variant_scoring_example(modules):
     
     try:
         API_KEY = get_api_key()
-        model = modules['dna_client'].create(API_KEY)
         
         print("🔬 Setting up variant scoring...")
         
@@ -222,12 +245,7 @@ def variant_scoring_example(modules):
         rna_scorer = modules['variant_scorers'].GeneExpressionScorer()
         
         # Get variant predictions
-        outputs = model.predict_variant(
-            interval=interval,
-            variant=variant,
-            ontology_terms=['UBERON:0001157'],  # liver tissue
-            requested_outputs=[modules['dna_client'].OutputType.RNA_SEQ],
-        )
+        outputs = predict_variant(API_KEY, interval, variant, 'RNA_SEQ')
         
         # Compute scores
         scores = rna_scorer.score(outputs)
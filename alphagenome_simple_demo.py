@@ -9,6 +9,7 @@ import sys
 
 # Import our environment loader helper
 from load_env_helper import get_api_key
+from client_helper import get_model
 
 def main():
     """Main demo function"""
@@ -38,7 +39,7 @@ def main():
         # Create the DNA client with API key
         # Note: Using the same variable name as in the example
         API_KEY = api_key
-        model = dna_client.create(API_KEY)
+        model = get_model(API_KEY)
         
         print("✅ Client created successfully")
         
@@ -79,9 +80,10 @@ def main():
         print(f"- Tissue: liver (UBERON:0001157)")
         print(f"- Output type: RNA-seq")
         
-        # Basic statistics
-        ref_mean = outputs.reference.rna_seq.values.mean()
-        alt_mean = outputs.alternate.rna_seq.values.mean()
+        # Basic statistics; accumulate in float32 to match the track dtype
+        # instead of upcasting every value to float64
+        ref_mean = float(outputs.reference.rna_seq.values.mean(dtype='float32'))
+        alt_mean = float(outputs.alternate.rna_seq.values.mean(dtype='float32'))
         difference = alt_mean - ref_mean
         
         print(f"\n📈 Signal Analysis:")
@@ -123,6 +125,8 @@ def main():
                 plt.show()
             except:
                 print("ℹ️ Plot display not available (saved to file instead)")
+            finally:
+                plt.close('all')
                 
         except Exception as e:
             print(f"⚠️ Visualization error: {e}")
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+AlphaGenome Client Helper
+Creates the AlphaGenome DNA client once per process and reuses it
+"""
+
+import functools
+import importlib
+
+# AlphaGenome modules served by LazyModules, keyed by the names the examples use
+ALPHAGENOME_MODULES = {
+    'gene_annotation': 'alphagenome.data.gene_annotation',
+    'genome': 'alphagenome.data.genome',
+    'transcript_utils': 'alphagenome.data.transcript',
+    'ism': 'alphagenome.interpretation.ism',
+    'dna_client': 'alphagenome.models.dna_client',
+    'variant_scorers': 'alphagenome.models.variant_scorers',
+    'plot_components': 'alphagenome.visualization.plot_components',
+}
+
+class LazyModules(dict):
+    """Dict of modules that imports each one on first lookup"""
+
+    def __init__(self, module_paths=ALPHAGENOME_MODULES):
+        super().__init__()
+        self.module_paths = module_paths
+
+    def __missing__(self, name):
+        module = importlib.import_module(self.module_paths[name])
+        self[name] = module
+        return module
+
+@functools.lru_cache(maxsize=1)
+def get_model(api_key):
+    """Return the AlphaGenome DNA client for api_key, creating it on first use"""
+    from alphagenome.models import dna_client
+    return dna_client.create(api_key)
@@ -4,23 +4,65 @@ Fix script for AlphaGenome protobuf compatibility issues
 This script will reinstall the correct versions of protobuf and related packages
 """
 
+import argparse
+import importlib
+import importlib.util
+import shutil
 import subprocess
 import sys
 import os
+from importlib import metadata
+
+try:
+    from packaging.specifiers import SpecifierSet
+    from packaging.version import Version
+except ImportError:
+    SpecifierSet = None
+
+# Package versions AlphaGenome's generated protobuf code is compatible with
+PINNED_PACKAGES = (
+    ("protobuf", ">=5.28.3"),
+    ("grpcio", ">=1.50.0"),
+    ("grpcio-status", ">=1.50.0"),
+)
+
+def needs_install(package, spec):
+    """Check whether a package is missing or outside the given version range"""
+    try:
+        installed = metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return True
+    if SpecifierSet is None:
+        # Without packaging we cannot compare versions, so reinstall to be safe
+        return True
+    return Version(installed) not in SpecifierSet(spec)
+
+# pip of the interpreter running this script, so installs land in its environment
+PIP = [sys.executable, "-m", "pip"]
+
+def pip_install(*args, reinstall=False):
+    """Install argv for this interpreter, using uv's faster resolver when it is on PATH"""
+    uv = shutil.which("uv")
+    if uv:
+        flags = ["--reinstall"] if reinstall else []
+        return [uv, "pip", "install", "--python", sys.executable, *flags, *args]
+    flags = ["--force-reinstall"] if reinstall else []
+    return PIP + ["install", *flags, *args]
 
 def run_command(cmd, description):
-    """Run a command with error handling"""
+    """Run a command (an argv list, no shell) with error handling"""
     print(f"🔧 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        # Let the installer's output stream to the console; uv reports its
+        # progress and pip its warnings on stderr, so neither is captured
+        subprocess.run(cmd, check=True)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed:")
-        print(f"Error: {e.stderr}")
+        print(f"❌ {description} failed (exit code {e.returncode}); see the output above")
         return False
 
-def main():
+def main(verify=False, force=False):
     """Main fix function"""
     print("🧬 AlphaGenome Protobuf Compatibility Fix")
     print("=" * 50)
@@ -39,23 +81,28 @@ def main():
     print("🔍 Current Python environment:")
     print(f"   Python: {sys.executable}")
     print(f"   Virtual env: {'Yes' if in_venv else 'No'}")
+    print(f"   Installer: {'uv' if shutil.which('uv') else 'pip'}")
     
     # Commands to fix the issue
-    commands = [
-        # Uninstall problematic packages
-        ("pip uninstall -y protobuf grpcio grpcio-status", "Uninstalling existing protobuf packages"),
-        
-        # Install specific compatible versions
-        ("pip install 'protobuf>=5.28.3'", "Installing compatible protobuf"),
-        ("pip install 'grpcio>=1.50.0'", "Installing compatible grpcio"),
-        ("pip install 'grpcio-status>=1.50.0'", "Installing compatible grpcio-status"),
-        
-        # Reinstall AlphaGenome to ensure compatibility
-        ("pip install --upgrade --force-reinstall alphagenome", "Reinstalling AlphaGenome"),
-        
-        # Install other requirements
-        ("pip install -r requirements.txt", "Installing remaining requirements"),
-    ]
+    commands = []
+    
+    # Reinstall compatible protobuf/grpcio versions together with AlphaGenome
+    # in one resolver pass; --force-reinstall replaces the old versions, so
+    # no separate uninstall is needed. Skipped when the installed versions
+    # already fit, unless --force asks to repair them anyway.
+    outdated = [(package, spec) for package, spec in PINNED_PACKAGES if needs_install(package, spec)]
+    if force or outdated or importlib.util.find_spec("alphagenome") is None:
+        pins = [package + spec for package, spec in PINNED_PACKAGES]
+        commands.append((
+            pip_install("--upgrade", *pins, "alphagenome", reinstall=True),
+            "Reinstalling compatible protobuf, grpcio and AlphaGenome",
+        ))
+    else:
+        print("✅ protobuf, grpcio and AlphaGenome already have compatible versions")
+        print("   (only version numbers were checked; run with --force to reinstall anyway)")
+    
+    # Install other requirements
+    commands.append((pip_install("-r", "requirements.txt"), "Installing remaining requirements"))
     
     success_count = 0
     for cmd, description in commands:
@@ -72,13 +119,17 @@ def main():
         print("2. Test the API connection using the 'Test API Connection' button")
         print("3. Try running a prediction with a small genomic region first")
         
-        # Test import
-        print("\n🧪 Testing AlphaGenome import...")
-        try:
-            from alphagenome.models import dna_client
-            print("✅ AlphaGenome import successful!")
-        except Exception as e:
-            print(f"❌ AlphaGenome import failed: {e}")
+        # Test import only on request; it loads the whole protobuf stack
+        if verify:
+            print("\n🧪 Testing AlphaGenome import...")
+            importlib.invalidate_caches()
+            try:
+                from alphagenome.models import dna_client
+                print("✅ AlphaGenome import successful!")
+            except Exception as e:
+                print(f"❌ AlphaGenome import failed: {e}")
+        else:
+            print("\n💡 Run with --verify to test the AlphaGenome import")
             
     else:
         print(f"⚠️  Some fixes failed ({success_count}/{len(commands)} succeeded)")
@@ -87,5 +138,11 @@ def main():
     return success_count == len(commands)
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="Fix AlphaGenome protobuf compatibility issues")
+    parser.add_argument("--verify", action="store_true",
+                        help="import AlphaGenome after the fix to check it loads")
+    parser.add_argument("--force", action="store_true",
+                        help="reinstall protobuf, grpcio and AlphaGenome even if their versions look compatible")
+    args = parser.parse_args()
+    success = main(verify=args.verify, force=args.force)
     sys.exit(0 if success else 1) 
\ No newline at end of file
@@ -5,60 +5,149 @@ Loads environment variables from .env file if available
 """
 
 import os
+import re
 import sys
 
-def load_env():
-    """Load environment variables from .env file if it exists"""
+# One KEY=VALUE assignment per line; comments and blank lines never match.
+# The value is captured already unquoted: "double", 'single' or bare.
+_ENV_LINE = re.compile(
+    r'^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*'
+    r'(?:"([^"\n]*)"|\'([^\'\n]*)\'|(.*?))[ \t\r]*$',
+    re.MULTILINE,
+)
+
+# .env locations to probe, nearest first
+_ENV_FILES = ('.env', '../.env', '../../.env')
+
+# Latest parse of each .env file per parser, keyed by (parser, path) and
+# stored with its (path, mtime, size) so repeated loads skip file I/O
+_ENV_CACHE = {}
+
+# API key returned by the first successful get_api_key() call. A missing key
+# is not cached, so setting it later in the process is still picked up.
+_API_KEY = None
+
+# python-dotenv functions, imported on first use; False once known to be missing
+_DOTENV = None
+
+# Cache key (absolute path, mtime, size) of the .env file each loader last
+# applied; while that file is unchanged and still the nearest candidate, later
+# loads return without touching os.environ again
+_APPLIED = {}
+
+def _read_env_manual(env_file):
+    """Parse KEY=VALUE pairs from an .env file without python-dotenv"""
+    # Scan the whole file with one compiled regex instead of per-line splitting
+    with open(env_file, 'r') as f:
+        return {
+            key: double or single or bare
+            for key, double, single, bare in _ENV_LINE.findall(f.read())
+        }
+
+def _cache_key(env_file):
+    """Return (path, mtime, size) for an .env file, or None if it does not exist"""
     try:
-        # Try to import python-dotenv
-        from dotenv import load_dotenv
-        
-        # Look for .env file in current directory and parent directories
-        env_files = ['.env', '../.env', '../../.env']
-        
-        for env_file in env_files:
-            if os.path.exists(env_file):
-                load_dotenv(env_file)
-                print(f"✅ Loaded environment variables from {env_file}")
+        st = os.stat(env_file)
+    except OSError:
+        return None
+    return (os.path.abspath(env_file), st.st_mtime_ns, st.st_size)
+
+def _parse_env(env_file, parser):
+    """Return (values, fresh, cache_key) for an .env file, or None if it does not exist"""
+    cache_key = _cache_key(env_file)
+    if cache_key is None:
+        return None
+    
+    entry = _ENV_CACHE.get((parser, cache_key[0]))
+    if entry is not None and entry[0] == cache_key:
+        return entry[1], False, cache_key
+    
+    # Replaces any stale parse of this file, so the cache never outgrows the files
+    values = parser(env_file)
+    _ENV_CACHE[(parser, cache_key[0])] = (cache_key, values)
+    return values, True, cache_key
+
+def _load_first_env_file(parser, override, label):
+    """Apply the nearest .env file to os.environ; returns True if one was found"""
+    applied = _APPLIED.get(label)
+    if applied is not None and _cache_key(applied[0]) == applied:
+        for env_file in _ENV_FILES:
+            path = os.path.abspath(env_file)
+            if path == applied[0]:
                 return True
+            if os.path.exists(path):
+                # A nearer .env file has appeared; load it below
+                break
+    
+    for env_file in _ENV_FILES:
+        try:
+            parsed = _parse_env(env_file, parser)
+        except Exception as e:
+            print(f"⚠️ Error loading {env_file}: {e}")
+            continue
+        if parsed is None:
+            continue
         
-        # If no .env file found, try loading from current directory
-        load_dotenv()
+        values, fresh, cache_key = parsed
+        if override:
+            os.environ.update(values)
+        else:
+            for key, value in values.items():
+                os.environ.setdefault(key, value)
+        if fresh:
+            print(f"✅ {label} environment variables from {env_file}")
+        _APPLIED[label] = cache_key
         return True
-        
-    except ImportError:
+    
+    return False
+
+def _import_dotenv():
+    """Import python-dotenv once; returns (dotenv_values, load_dotenv) or None"""
+    global _DOTENV
+    if _DOTENV is None:
+        try:
+            from dotenv import dotenv_values, load_dotenv
+            _DOTENV = (dotenv_values, load_dotenv)
+        except ImportError:
+            _DOTENV = False
+    return _DOTENV or None
+
+def _read_env_dotenv(env_file):
+    """Parse an .env file with python-dotenv, dropping keys without values"""
+    dotenv_values = _import_dotenv()[0]
+    return {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+
+def load_env():
+    """Load environment variables from .env file if it exists"""
+    dotenv = _import_dotenv()
+    if dotenv is None:
         # python-dotenv not installed, try manual loading
         return load_env_manual()
+    
+    # Look for .env file in current directory and parent directories
+    if _load_first_env_file(_read_env_dotenv, override=False, label="Loaded"):
+        return True
+    
+    # If no .env file found, try loading from current directory
+    load_dotenv = dotenv[1]
+    load_dotenv()
+    return True
 
 def load_env_manual():
     """Manually load .env file if python-dotenv is not available"""
-    env_files = ['.env', '../.env', '../../.env']
-    
-    for env_file in env_files:
-        if os.path.exists(env_file):
-            try:
-                with open(env_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            value = value.strip().strip('"').strip("'")
-                            os.environ[key] = value
-                print(f"✅ Manually loaded environment variables from {env_file}")
-                return True
-            except Exception as e:
-                print(f"⚠️ Error loading {env_file}: {e}")
-    
-    return False
+    return _load_first_env_file(_read_env_manual, override=True, label="Manually loaded")
 
 def get_api_key():
     """Get API key from environment, loading .env if necessary"""
-    # First try to load from .env
-    load_env()
+    global _API_KEY
+    if _API_KEY is not None:
+        return _API_KEY
     
-    # Now get the API key
+    # A key exported in the environment wins; only look for .env files without one
     api_key = os.getenv('ALPHA_GENOME_API_KEY')
+    if not api_key:
+        load_env()
+        api_key = os.getenv('ALPHA_GENOME_API_KEY')
     
     if not api_key:
         print("❌ ALPHA_GENOME_API_KEY not found")
@@ -69,8 +158,14 @@ def get_api_key():
         return None
     
     print("✅ API key loaded successfully")
+    _API_KEY = api_key
     return api_key
 
+def clear_api_key_cache():
+    """Forget the cached API key so the next get_api_key() looks it up again"""
+    global _API_KEY
+    _API_KEY = None
+
 if __name__ == "__main__":
     # Test the loader
     api_key = get_api_key()
@@ -3,6 +3,7 @@
 Launch script for the AlphaGenome Streamlit demo
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
@@ -13,10 +14,9 @@ def main():
     print("=" * 50)
     
     # Check if streamlit is installed
-    try:
-        import streamlit
+    if importlib.util.find_spec("streamlit") is not None:
         print("✅ Streamlit found")
-    except ImportError:
+    else:
         print("❌ Streamlit not found. Installing...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "streamlit"])
         print("✅ Streamlit installed")
@@ -4,6 +4,7 @@ AlphaGenome Setup and Basic Usage
 This script demonstrates how to set up and use AlphaGenome according to the official documentation.
 """
 
+import importlib
 import sys
 import subprocess
 import os
@@ -31,6 +32,8 @@ def test_import():
     """Test if AlphaGenome can be imported successfully"""
     try:
         print("🧪 Testing AlphaGenome import...")
+        # Pick up packages installed by pip earlier in this process
+        importlib.invalidate_caches()
         from alphagenome.data import genome
         from alphagenome.models import dna_client
         import numpy as np
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+AlphaGenome Statistics Helper
+Optional Numba kernels for prediction statistics, compiled once per process
+"""
+
+import threading
+
+import numpy as np
+
+try:
+    # Numba is optional; callers fall back to NumPy when it is missing
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+# Numba's default workqueue threading layer aborts the process when two threads
+# launch parallel kernels at once (e.g. concurrent Streamlit sessions)
+_KERNEL_LOCK = threading.Lock()
+
+# Reassociation lets the reductions vectorize; the no-inf/no-NaN assumptions of
+# fastmath=True are left off because min/max start from +/-inf
+_FASTMATH = {'reassoc', 'contract'}
+
+if NUMBA_AVAILABLE:
+    # Explicit signatures compile eagerly when this module is first imported (and
+    # cache=True stores the machine code in __pycache__), so no call pays JIT latency
+    @njit('f4[::1](f4[:, ::1])', parallel=True, fastmath=_FASTMATH, cache=True)
+    def _track_mean_kernel(values):
+        """Mean across tracks for each position, one position per iteration"""
+        n_positions, n_tracks = values.shape
+        means = np.empty(n_positions, dtype=np.float32)
+        for i in prange(n_positions):
+            total = 0.0
+            for j in range(n_tracks):
+                total += values[i, j]
+            means[i] = total / n_tracks
+        return means
+
+    @njit('UniTuple(f8, 4)(f4[::1])', parallel=True, fastmath=_FASTMATH, cache=True)
+    def _summary_kernel(values):
+        """Fused mean/std/min/max of an array in a single pass"""
+        total = 0.0
+        total_sq = 0.0
+        low = np.inf
+        high = -np.inf
+        for i in prange(values.size):
+            v = values[i]
+            total += v
+            total_sq += v * v
+            low = min(low, v)
+            high = max(high, v)
+        mean = total / values.size
+        return mean, np.sqrt(max(total_sq / values.size - mean * mean, 0.0)), low, high
+
+    @njit('UniTuple(f8, 4)(f4[::1], f4[::1])', parallel=True, fastmath=_FASTMATH, cache=True)
+    def _difference_kernel(ref, alt):
+        """Fused mean/std/min/max of alt - ref in a single pass, without a difference array"""
+        total = 0.0
+        total_sq = 0.0
+        low = np.inf
+        high = -np.inf
+        for i in prange(ref.size):
+            d = alt[i] - ref[i]
+            total += d
+            total_sq += d * d
+            low = min(low, d)
+            high = max(high, d)
+        mean = total / ref.size
+        return mean, np.sqrt(max(total_sq / ref.size - mean * mean, 0.0)), low, high
+
+def _flat_float32(values):
+    """Contiguous 1-D float32 view (or copy) of an array"""
+    return np.ascontiguousarray(values, dtype=np.float32).ravel()
+
+def fused_track_mean(values):
+    """Average a (positions, tracks) array across its tracks; requires Numba"""
+    values = np.ascontiguousarray(values, dtype=np.float32)
+    with _KERNEL_LOCK:
+        return _track_mean_kernel(values)
+
+def fused_summary_stats(values):
+    """Return (mean, std, min, max) of an array in one pass; requires Numba"""
+    values = _flat_float32(values)
+    with _KERNEL_LOCK:
+        return _summary_kernel(values)
+
+def fused_difference_stats(ref_data, alt_data):
+    """Return (mean, std, min, max) of alt - ref in one pass; requires Numba"""
+    ref = _flat_float32(ref_data)
+    alt = _flat_float32(alt_data)
+    with _KERNEL_LOCK:
+        return _difference_kernel(ref, alt)
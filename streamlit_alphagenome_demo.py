@@ -9,16 +9,22 @@ import os
 import sys
 import traceback
 import time
-import matplotlib.pyplot as plt
+import threading
 import numpy as np
 import io
 import warnings
 
+# matplotlib is imported only once something is plotted; render off-screen
+# with Agg whenever that happens, since Streamlit displays the saved images
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
 # Suppress protobuf warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="google.protobuf")
 
 # Import our environment loader helper
 from load_env_helper import get_api_key
+from client_helper import get_model
+from stats_helper import NUMBA_AVAILABLE, fused_difference_stats, fused_track_mean
 
 # Page configuration
 st.set_page_config(
@@ -29,330 +35,187 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
-<style>
-    /* CSS Custom Properties for theme adaptation */
-    :root {
-        --primary-color: #1f77b4;
-        --success-color: #32cd32;
-        --error-color: #ff4444;
-        --warning-color: #ffa500;
-        --info-color: #1f77b4;
-    }
-    
-    /* Theme-adaptive colors */
-    @media (prefers-color-scheme: light) {
-        :root {
-            --card-bg-color: #ffffff;
-            --card-text-color: #333333;
-            --card-border-color: rgba(0,0,0,0.1);
-            --card-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            --secondary-bg-color: #f8f9fa;
-        }
-    }
-    
-    @media (prefers-color-scheme: dark) {
-        :root {
-            --card-bg-color: #262730;
-            --card-text-color: #ffffff;
-            --card-border-color: rgba(255,255,255,0.1);
-            --card-shadow: 0 2px 4px rgba(0,0,0,0.3);
-            --secondary-bg-color: #1e1e1e;
-        }
-    }
-    
-    /* Fallback for browsers that don't support prefers-color-scheme */
-    [data-theme="light"] {
-        --card-bg-color: #ffffff;
-        --card-text-color: #333333;
-        --card-border-color: rgba(0,0,0,0.1);
-        --card-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        --secondary-bg-color: #f8f9fa;
-    }
-    
-    [data-theme="dark"] {
-        --card-bg-color: #262730;
-        --card-text-color: #ffffff;
-        --card-border-color: rgba(255,255,255,0.1);
-        --card-shadow: 0 2px 4px rgba(0,0,0,0.3);
-        --secondary-bg-color: #1e1e1e;
-    }
-    
-    /* Main header styling - works with both themes */
-    .main-header {
-        font-size: 3rem;
-        color: var(--primary-color);
-        text-align: center;
-        margin-bottom: 2rem;
-        font-weight: bold;
-    }
-    
-    /* Sub headers - use default theme colors */
-    .sub-header {
-        font-size: 1.5rem;
-        margin: 1rem 0;
-        font-weight: bold;
-    }
-    
-    /* Base card styling */
-    .card-base {
-        background-color: var(--card-bg-color);
-        color: var(--card-text-color);
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-        box-shadow: var(--card-shadow);
-        border: 1px solid var(--card-border-color);
-        transition: all 0.3s ease;
-    }
-    
-    .card-base:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-    }
-    
-    /* Info boxes with theme-adaptive colors */
-    .info-box {
-        background-color: var(--card-bg-color);
-        color: var(--card-text-color);
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid var(--primary-color);
-        margin: 1rem 0;
-        box-shadow: var(--card-shadow);
-        border: 1px solid var(--card-border-color);
-        transition: all 0.3s ease;
-    }
-    
-    .info-box:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-    }
-    
-    .info-box h4 {
-        color: var(--primary-color);
-        margin-top: 0;
-        margin-bottom: 0.5rem;
-    }
-    
-    .info-box ul {
-        margin: 0;
-        padding-left: 1.2rem;
-    }
-    
-    .info-box li {
-        margin-bottom: 0.3rem;
-        color: var(--card-text-color);
-    }
-    
-    .success-box {
-        background-color: var(--card-bg-color);
-        color: var(--card-text-color);
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid var(--success-color);
-        margin: 1rem 0;
-        box-shadow: var(--card-shadow);
-        border: 1px solid var(--card-border-color);
-        transition: all 0.3s ease;
-    }
-    
-    .success-box:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-    }
-    
-    .success-box h4 {
-        color: var(--success-color);
-        margin-top: 0;
-        margin-bottom: 0.5rem;
-    }
-    
-    .error-box {
-        background-color: var(--card-bg-color);
-        color: var(--card-text-color);
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid var(--error-color);
-        margin: 1rem 0;
-        box-shadow: var(--card-shadow);
-        border: 1px solid var(--card-border-color);
-        transition: all 0.3s ease;
-    }
-    
-    .error-box:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-    }
-    
-    .error-box h3 {
-        color: var(--error-color);
-        margin-top: 0;
-        margin-bottom: 0.5rem;
-    }
-    
-    .error-box a {
-        color: var(--primary-color);
-        text-decoration: underline;
-    }
-    
-    .error-box code {
-        background-color: var(--secondary-bg-color);
-        padding: 0.2rem 0.4rem;
-        border-radius: 3px;
-        font-family: 'Monaco', 'Consolas', monospace;
-        font-size: 0.9em;
-    }
-    
-    .metric-container {
-        background-color: var(--card-bg-color);
-        color: var(--card-text-color);
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-        box-shadow: var(--card-shadow);
-        border: 1px solid var(--card-border-color);
-        transition: all 0.3s ease;
-    }
-    
-    .metric-container:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-    }
-    
-    .metric-container h4 {
-        color: var(--primary-color);
-        margin-top: 0;
-        margin-bottom: 0.5rem;
-    }
-    
-    .metric-container ul {
-        margin: 0;
-        padding-left: 1.2rem;
-    }
-    
-    .metric-container li {
-        margin-bottom: 0.3rem;
-        color: var(--card-text-color);
-    }
-    
-    .config-summary {
-        background-color: var(--card-bg-color);
-        color: var(--card-text-color);
-        padding: 0.8rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid var(--primary-color);
-        margin: 0.5rem 0;
-        font-size: 0.95rem;
-        box-shadow: var(--card-shadow);
-        border: 1px solid var(--card-border-color);
-        transition: all 0.3s ease;
-    }
-    
-    .config-summary:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-    }
-    
-    /* Ensure good contrast for both themes */
-    .stMarkdown a {
-        color: var(--primary-color) !important;
-        text-decoration: underline;
-    }
-    
-    .stMarkdown a:hover {
-        color: #0d5aa7 !important;
-        opacity: 0.8;
-    }
-    
-    /* Status text colors - theme adaptive */
-    .status-text-success {
-        color: var(--success-color) !important;
-        font-weight: bold;
-    }
-    
-    .status-text-info {
-        color: var(--info-color) !important;
-        font-weight: bold;
-    }
-    
-    .status-text-default {
-        font-weight: bold;
-        color: var(--card-text-color);
-    }
-    
-    /* Make sure metrics are readable */
-    .metric-label {
-        font-weight: bold;
-    }
-    
-    /* Code blocks - adaptive */
-    .stCode {
-        background-color: var(--secondary-bg-color) !important;
-        color: var(--card-text-color) !important;
-        border: 1px solid var(--card-border-color) !important;
-    }
-    
-    /* Progress bar text */
-    .stProgress .stText {
-        font-weight: bold;
-    }
-    
-    /* Buttons maintain their theme colors */
-    .stButton button {
-        font-weight: bold;
-    }
-    
-    /* Expandable sections */
-    .streamlit-expanderHeader {
-        font-weight: bold;
-    }
-    
-    /* Alert styling */
-    .stAlert {
-        border-radius: 0.5rem;
-        border: 1px solid var(--card-border-color);
-    }
-    
-    /* Responsive design for smaller screens */
-    @media (max-width: 768px) {
-        .main-header {
-            font-size: 2rem;
-        }
-        
-        .info-box, .success-box, .error-box, .metric-container, .config-summary {
-            margin: 0.5rem 0;
-            padding: 0.8rem;
-        }
-    }
-    
-    /* Smooth transitions for theme changes */
-    * {
-        transition: background-color 0.3s ease, color 0.3s ease, border-color 0.3s ease;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data(show_spinner=False)
+def load_css():
+    """Read the app stylesheet once; later reruns reuse the cached string"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'app.css')) as f:
+        return f.read()
+
+st.markdown(f"<style>\n{load_css()}</style>", unsafe_allow_html=True)
+
+# Sidebar choices and the tissue ontology terms they map to
+PREDEFINED_REGIONS = {
+    "Default (chr22)": {"chr": "chr22", "start": 35677410, "end": 36725986},
+    "Small region (chr1)": {"chr": "chr1", "start": 1000000, "end": 1100000},
+    "Medium region (chr22)": {"chr": "chr22", "start": 36000000, "end": 36200000},
+}
+REGION_NAMES = tuple(PREDEFINED_REGIONS)
+
+TISSUE_OPTIONS = {
+    "Liver": "UBERON:0001157",
+    "Lung": "UBERON:0002048",
+    "Heart": "UBERON:0000948",
+    "Brain": "UBERON:0000955",
+    "Kidney": "UBERON:0002113"
+}
+TISSUE_NAMES = tuple(TISSUE_OPTIONS)
+
+# Long track paths are simplified (segments closer than a pixel merged) and
+# drawn in chunks so Agg stays fast on genome-length lines
+_MATPLOTLIB_RC = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+def _configure_matplotlib():
+    """Import matplotlib and apply the demo's rendering settings"""
+    import matplotlib
+    matplotlib.rcParams.update(_MATPLOTLIB_RC)
+
+def _warm_fonts():
+    """Import matplotlib and render some text so font loading happens off the request path"""
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(2, 1))
+    fig.text(0.5, 0.5, 'AlphaGenome 0123456789')
+    fig.savefig(io.BytesIO(), format='png')
+
+@st.cache_resource(show_spinner=False)
+def start_matplotlib_warmup():
+    """Warm matplotlib's font caches in a background thread, once per server process"""
+    thread = threading.Thread(target=_warm_fonts, name='matplotlib-warmup', daemon=True)
+    thread.start()
+    return thread
+
+def _track_figure():
+    """Return a new two-row Figure and its axes"""
+    _configure_matplotlib()
+    # Built without pyplot, so no figure manager is registered and nothing
+    # needs closing; the PNG cache means this only runs for new track pairs
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(12, 8))
+    ax1, ax2 = fig.subplots(2, 1)
+    # Fixed margins for this known layout instead of tight_layout/bbox_inches='tight',
+    # which both need an extra measuring draw
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.95, bottom=0.07, hspace=0.3)
+    return fig, ax1, ax2
+
+def track_mean(values):
+    """Average a (positions, tracks) prediction array across its tracks"""
+    if NUMBA_AVAILABLE:
+        return fused_track_mean(values)
+    return values.mean(axis=1, dtype=np.float32)
+
+def difference_stats(ref_data, alt_data):
+    """Mean, min, max and standard deviation of alt - ref using a single scratch array"""
+    if NUMBA_AVAILABLE:
+        diff_mean, diff_std, diff_min, diff_max = fused_difference_stats(ref_data, alt_data)
+        return diff_mean, diff_min, diff_max, diff_std
+    
+    diff = np.empty_like(ref_data)
+    np.subtract(alt_data, ref_data, out=diff)
+    # Mean of the difference itself; subtracting two float32 allele means
+    # would lose the ~1e-5 shifts a single variant causes
+    diff_mean = diff.mean(dtype=np.float64)
+    diff_min = diff.min()
+    diff_max = diff.max()
+    # Center and square in place; the variance is then the buffer's mean,
+    # accumulated in float64
+    flat = diff.ravel()
+    np.subtract(flat, diff_mean, out=flat, casting='unsafe')
+    np.square(flat, out=flat)
+    diff_std = np.sqrt(flat.mean(dtype=np.float64))
+    return diff_mean, diff_min, diff_max, diff_std
+
+# Successful connection tests are reused for five minutes; failures raise, are
+# never cached, and so are retried on the next click
+@st.cache_resource(show_spinner=False, ttl=300)
+def get_output_metadata(api_key):
+    """Fetch human output metadata per API key, shared across reruns"""
+    from alphagenome.models import dna_client
+    return get_model(api_key).output_metadata(organism=dna_client.Organism.HOMO_SAPIENS)
+
+def make_interval(chromosome, start_pos, end_pos):
+    """Return the genome.Interval for a region"""
+    from alphagenome.data import genome
+    return genome.Interval(chromosome=chromosome, start=start_pos, end=end_pos)
+
+def make_variant(chromosome, variant_pos, ref_base, alt_base):
+    """Return the genome.Variant for a substitution"""
+    from alphagenome.data import genome
+    return genome.Variant(
+        chromosome=chromosome,
+        position=variant_pos,
+        reference_bases=ref_base,
+        alternate_bases=alt_base,
+    )
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=64)
+def predict_variant(api_key, chromosome, start_pos, end_pos, variant_pos, ref_base, alt_base, tissue_ontology):
+    """Predict RNA-seq for a variant; repeated identical requests come from the cache"""
+    from alphagenome.models import dna_client
+    return get_model(api_key).predict_variant(
+        interval=make_interval(chromosome, start_pos, end_pos),
+        variant=make_variant(chromosome, variant_pos, ref_base, alt_base),
+        ontology_terms=[tissue_ontology],
+        requested_outputs=[dna_client.OutputType.RNA_SEQ],
+    )
 
 def test_alphagenome_connection(api_key):
     """Test AlphaGenome connection"""
     try:
-        from alphagenome.models import dna_client
-        model = dna_client.create(api_key)
         # Try to get metadata as a simple test
-        metadata = model.output_metadata(organism=dna_client.Organism.HOMO_SAPIENS)
+        get_output_metadata(api_key)
         return True, "Connection successful"
     except Exception as e:
         return False, str(e)
 
+# Reruns triggered by widgets inside a fragment (the download and reset buttons)
+# re-execute only that fragment; older Streamlit versions run it as a plain function
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+@_fragment
+def results_section():
+    """Display the latest prediction results or error, if any"""
+    if st.session_state.prediction_results is not None:
+        if st.session_state.prediction_results['success']:
+            # Label with the tissue the prediction ran for, not the current sidebar choice
+            display_results(
+                st.session_state.prediction_results['outputs'],
+                st.session_state.prediction_results['interval'],
+                st.session_state.prediction_results['variant'],
+                st.session_state.prediction_results['tissue_name'],
+                st.session_state.prediction_results['tissue_ontology']
+            )
+        else:
+            st.error(f"❌ Error during prediction: {st.session_state.prediction_results['error']}")
+            
+            # Show detailed error in expander
+            with st.expander("🔍 Detailed Error Information"):
+                st.code(st.session_state.prediction_results['traceback'])
+                
+                # Common issues and solutions
+                st.markdown("""
+                <div class="card-base">
+                <strong>Common Issues:</strong><br>
+                • <strong>API Key:</strong> Ensure your API key is valid and has quota remaining<br>
+                • <strong>Network:</strong> Check your internet connection<br>
+                • <strong>Region Size:</strong> Try a smaller genomic region<br>
+                • <strong>Protobuf:</strong> Version conflicts (restart the app if needed)
+                </div>
+                """, unsafe_allow_html=True)
+    
+
 def main():
     """Main Streamlit application"""
     
     # Initialize session state
-    if 'prediction_running' not in st.session_state:
-        st.session_state.prediction_running = False
     if 'prediction_results' not in st.session_state:
         st.session_state.prediction_results = None
     
+    # Load matplotlib and fonts while the user fills in the form
+    start_matplotlib_warmup()
+    
     # Header
     st.markdown('<h1 class="main-header">🧬 AlphaGenome Interactive Demo</h1>', unsafe_allow_html=True)
     st.markdown('<div style="font-size: 1.1rem; text-align: center; font-weight: 500; margin-bottom: 2rem;"><strong>Explore Google DeepMind\'s AlphaGenome API for genomic variant effect prediction</strong></div>', unsafe_allow_html=True)
@@ -423,19 +286,13 @@ def main():
     )
     
     # Predefined regions for easy selection
-    predefined_regions = {
-        "Default (chr22)": {"chr": "chr22", "start": 35677410, "end": 36725986},
-        "Small region (chr1)": {"chr": "chr1", "start": 1000000, "end": 1100000},
-        "Medium region (chr22)": {"chr": "chr22", "start": 36000000, "end": 36200000},
-    }
-    
     selected_region = st.sidebar.selectbox(
         "Predefined Regions",
-        list(predefined_regions.keys()),
+        REGION_NAMES,
         help="Choose a predefined genomic region"
     )
     
-    region = predefined_regions[selected_region]
+    region = PREDEFINED_REGIONS[selected_region]
     
     # Allow manual override
     if st.sidebar.checkbox("Manual coordinates"):
@@ -484,27 +341,19 @@ def main():
     )
     
     # Tissue selection
-    tissue_options = {
-        "Liver": "UBERON:0001157",
-        "Lung": "UBERON:0002048", 
-        "Heart": "UBERON:0000948",
-        "Brain": "UBERON:0000955",
-        "Kidney": "UBERON:0002113"
-    }
-    
     selected_tissue = st.sidebar.selectbox(
         "Tissue Type",
-        list(tissue_options.keys()),
+        TISSUE_NAMES,
         help="Select tissue for prediction"
     )
     
-    tissue_ontology = tissue_options[selected_tissue]
+    tissue_ontology = TISSUE_OPTIONS[selected_tissue]
     
     # Main content area
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.markdown('<h2 class="sub-header">📊 Analysis Overview</h2>', unsafe_allow_html=True)
+        st.header("📊 Analysis Overview")
         
         # Compact configuration display
         st.markdown(f"""
@@ -516,53 +365,23 @@ def main():
         """, unsafe_allow_html=True)
     
     with col2:
-        st.markdown('<h2 class="sub-header">🚀 Run Analysis</h2>', unsafe_allow_html=True)
-        
-        # Disable button if prediction is running
-        button_disabled = st.session_state.prediction_running
-        button_text = "🔄 Running..." if button_disabled else "🔬 Run AlphaGenome Prediction"
+        st.header("🚀 Run Analysis")
         
-        if st.button(button_text, type="primary", use_container_width=True, disabled=button_disabled):
-            st.session_state.prediction_running = True
-            st.session_state.prediction_results = None
-            st.rerun()
+        run_clicked = st.button("🔬 Run AlphaGenome Prediction", type="primary", use_container_width=True)
     
-    # Handle prediction execution
-    if st.session_state.prediction_running and st.session_state.prediction_results is None:
+    # Run the prediction in this script run; results land in session state and
+    # are displayed below without another rerun
+    if run_clicked:
         run_alphagenome_demo(
             api_key, chromosome, start_pos, end_pos,
             variant_pos, ref_base, alt_base, tissue_ontology, selected_tissue
         )
     
     # Display results if available
-    if st.session_state.prediction_results is not None:
-        if st.session_state.prediction_results['success']:
-            display_results(
-                st.session_state.prediction_results['outputs'],
-                st.session_state.prediction_results['interval'],
-                st.session_state.prediction_results['variant'],
-                selected_tissue
-            )
-        else:
-            st.error(f"❌ Error during prediction: {st.session_state.prediction_results['error']}")
-            
-            # Show detailed error in expander
-            with st.expander("🔍 Detailed Error Information"):
-                st.code(st.session_state.prediction_results['traceback'])
-                
-                # Common issues and solutions
-                st.markdown("""
-                <div class="card-base">
-                <strong>Common Issues:</strong><br>
-                • <strong>API Key:</strong> Ensure your API key is valid and has quota remaining<br>
-                • <strong>Network:</strong> Check your internet connection<br>
-                • <strong>Region Size:</strong> Try a smaller genomic region<br>
-                • <strong>Protobuf:</strong> Version conflicts (restart the app if needed)
-                </div>
-                """, unsafe_allow_html=True)
+    results_section()
     
     # Information sections
-    st.markdown('<h2 class="sub-header">📚 About AlphaGenome</h2>', unsafe_allow_html=True)
+    st.header("📚 About AlphaGenome")
     
     col1, col2, col3 = st.columns(3)
     
@@ -607,69 +426,48 @@ def main():
 def run_alphagenome_demo(api_key, chromosome, start_pos, end_pos, variant_pos, ref_base, alt_base, tissue_ontology, tissue_name):
     """Run the AlphaGenome prediction demo"""
     
-    # Create progress container
-    st.markdown('<h2 class="sub-header">⚡ Running Analysis</h2>', unsafe_allow_html=True)
-    
-    # Progress bar and status
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    # Progress widgets share one placeholder so they disappear once the run ends
+    progress_area = st.empty()
+    with progress_area.container():
+        st.header("⚡ Running Analysis")
+        
+        # Progress bar and status
+        progress_bar = st.progress(0)
+        status_text = st.empty()
     
     try:
-        # Step 1: Import dependencies
-        status_text.markdown('<p class="status-text-default">📦 Importing AlphaGenome modules...</p>', unsafe_allow_html=True)
-        progress_bar.progress(10)
-        
-        from alphagenome.data import genome
-        from alphagenome.models import dna_client
-        from alphagenome.visualization import plot_components
-        
-        status_text.markdown('<p class="status-text-success">✅ Imports successful</p>', unsafe_allow_html=True)
-        progress_bar.progress(20)
-        
-        # Step 2: Create client
+        # Step 1: Create client (this also imports the AlphaGenome modules)
         status_text.markdown('<p class="status-text-default">🔧 Setting up AlphaGenome client...</p>', unsafe_allow_html=True)
-        progress_bar.progress(30)
+        progress_bar.progress(20)
         
-        model = dna_client.create(api_key)
+        get_model(api_key)
         
         status_text.markdown('<p class="status-text-success">✅ Client created successfully</p>', unsafe_allow_html=True)
         progress_bar.progress(40)
         
-        # Step 3: Define genomic objects
+        # Step 2: Define genomic objects
         status_text.markdown('<p class="status-text-default">🧬 Creating genomic interval and variant...</p>', unsafe_allow_html=True)
         progress_bar.progress(50)
         
-        interval = genome.Interval(
-            chromosome=chromosome, 
-            start=start_pos, 
-            end=end_pos
-        )
-        
-        variant = genome.Variant(
-            chromosome=chromosome,
-            position=variant_pos,
-            reference_bases=ref_base,
-            alternate_bases=alt_base,
-        )
+        interval = make_interval(chromosome, start_pos, end_pos)
+        variant = make_variant(chromosome, variant_pos, ref_base, alt_base)
         
         status_text.markdown('<p class="status-text-success">✅ Genomic objects created</p>', unsafe_allow_html=True)
         progress_bar.progress(60)
         
-        # Step 4: Make prediction
+        # Step 3: Make prediction
         status_text.markdown('<p class="status-text-info">🔮 Making variant effect prediction... (this may take a moment)</p>', unsafe_allow_html=True)
         progress_bar.progress(70)
         
-        outputs = model.predict_variant(
-            interval=interval,
-            variant=variant,
-            ontology_terms=[tissue_ontology],
-            requested_outputs=[dna_client.OutputType.RNA_SEQ],
+        outputs = predict_variant(
+            api_key, chromosome, start_pos, end_pos,
+            variant_pos, ref_base, alt_base, tissue_ontology
         )
         
         status_text.markdown('<p class="status-text-success">✅ Prediction completed!</p>', unsafe_allow_html=True)
         progress_bar.progress(90)
         
-        # Step 5: Process results
+        # Step 4: Process results
         status_text.markdown('<p class="status-text-default">📊 Processing results...</p>', unsafe_allow_html=True)
         progress_bar.progress(100)
         
@@ -678,16 +476,13 @@ def run_alphagenome_demo(api_key, chromosome, start_pos, end_pos, variant_pos, r
             'success': True,
             'outputs': outputs,
             'interval': interval,
-            'variant': variant
+            'variant': variant,
+            'tissue_name': tissue_name,
+            'tissue_ontology': tissue_ontology
         }
-        st.session_state.prediction_running = False
         
         # Clear progress indicators
-        progress_bar.empty()
-        status_text.empty()
-        
-        # Force rerun to display results
-        st.rerun()
+        progress_area.empty()
         
     except Exception as e:
         # Store error in session state
@@ -696,29 +491,33 @@ def run_alphagenome_demo(api_key, chromosome, start_pos, end_pos, variant_pos, r
             'error': str(e),
             'traceback': traceback.format_exc()
         }
-        st.session_state.prediction_running = False
         
         # Clear progress indicators
-        progress_bar.empty()
-        status_text.empty()
-        
-        # Force rerun to display error
-        st.rerun()
+        progress_area.empty()
+
+def clear_results():
+    """Forget the last prediction so the page returns to its initial state"""
+    st.session_state.prediction_results = None
 
-def display_results(outputs, interval, variant, tissue_name):
+def display_results(outputs, interval, variant, tissue_name, tissue_ontology):
     """Display the prediction results"""
     
-    st.markdown('<h2 class="sub-header">📈 Prediction Results</h2>', unsafe_allow_html=True)
+    st.header("📈 Prediction Results")
     
     # Extract data
     ref_data = outputs.reference.rna_seq.values
     alt_data = outputs.alternate.rna_seq.values
-    difference = alt_data - ref_data
     
-    # Summary statistics
-    ref_mean = ref_data.mean()
-    alt_mean = alt_data.mean()
-    diff_mean = difference.mean()
+    # Per-position mean tracks, computed once and reused by the plot
+    ref_track = track_mean(ref_data)
+    alt_track = track_mean(alt_data)
+    
+    # Summary statistics; every position has the same number of tracks, so the
+    # overall means follow from the 1-D tracks without another full pass
+    ref_mean = ref_track.mean()
+    alt_mean = alt_track.mean()
+    diff_mean, diff_min, diff_max, diff_std = difference_stats(ref_data, alt_data)
+    max_abs_diff = max(-diff_min, diff_max)
     
     # Results overview
     col1, col2, col3, col4 = st.columns(4)
@@ -754,7 +553,7 @@ def display_results(outputs, interval, variant, tissue_name):
         )
     
     # Detailed statistics
-    st.markdown('<h3 class="sub-header">📊 Detailed Statistics</h3>', unsafe_allow_html=True)
+    st.subheader("📊 Detailed Statistics")
     
     stats_col1, stats_col2 = st.columns(2)
     
@@ -776,16 +575,16 @@ def display_results(outputs, interval, variant, tissue_name):
         <div class="metric-container">
         <h4>📈 Signal Statistics</h4>
         <ul>
-        <li><strong>Max absolute difference:</strong> {abs(difference).max():.6f}</li>
-        <li><strong>Standard deviation:</strong> {difference.std():.6f}</li>
-        <li><strong>Min difference:</strong> {difference.min():.6f}</li>
-        <li><strong>Max difference:</strong> {difference.max():.6f}</li>
+        <li><strong>Max absolute difference:</strong> {max_abs_diff:.6f}</li>
+        <li><strong>Standard deviation:</strong> {diff_std:.6f}</li>
+        <li><strong>Min difference:</strong> {diff_min:.6f}</li>
+        <li><strong>Max difference:</strong> {diff_max:.6f}</li>
         </ul>
         </div>
         """, unsafe_allow_html=True)
     
     # Interpretation
-    st.markdown('<h3 class="sub-header">🎯 Biological Interpretation</h3>', unsafe_allow_html=True)
+    st.subheader("🎯 Biological Interpretation")
     
     if abs(diff_mean) > 0.001:
         effect = "increases" if diff_mean > 0 else "decreases"
@@ -795,24 +594,22 @@ def display_results(outputs, interval, variant, tissue_name):
         st.info(f"The variant {variant.chromosome}:{variant.position} {variant.reference_bases}>{variant.alternate_bases} has minimal effect on RNA expression in {tissue_name.lower()} tissue.")
     
     # Visualization
-    st.markdown('<h3 class="sub-header">📊 Visualization</h3>', unsafe_allow_html=True)
+    st.subheader("📊 Visualization")
     
     try:
-        create_visualization(outputs, variant, tissue_name)
+        create_visualization(outputs, variant, tissue_name, ref_track, alt_track)
         
         # Try AlphaGenome's native visualization too
-        st.markdown('<h3 class="sub-header">🎨 AlphaGenome Native Visualization</h3>', unsafe_allow_html=True)
-        create_alphagenome_native_plot(outputs, variant, tissue_name)
+        st.subheader("🎨 AlphaGenome Native Visualization")
+        create_alphagenome_native_plot(outputs, variant, tissue_name, tissue_ontology)
         
     except Exception as e:
         st.warning(f"⚠️ Visualization not available: {str(e)}")
         st.info("This is normal in some environments. Results are still valid.")
     
-    # Reset button
-    if st.button("🔄 Run Another Analysis", type="secondary"):
-        st.session_state.prediction_results = None
-        st.session_state.prediction_running = False
-        st.rerun()
+    # Reset button; the callback runs before the next script run, so the
+    # results are already gone when it renders
+    st.button("🔄 Run Another Analysis", type="secondary", on_click=clear_results)
     
     # Success message
     st.markdown("""
@@ -822,43 +619,67 @@ def display_results(outputs, interval, variant, tissue_name):
     </div>
     """, unsafe_allow_html=True)
 
-def create_visualization(outputs, variant, tissue_name):
+# Points drawn per track, about three per horizontal pixel of the 1200 px plot
+PLOT_POINTS = 4000
+
+def decimate_track(track, max_points=PLOT_POINTS):
+    """Shrink a long track to a per-bin min/max envelope; returns (x, y) to plot"""
+    if track.size <= max_points:
+        return np.arange(track.size), track
+    # Each bin contributes its min and max, drawn as a vertical segment, so
+    # spikes survive at display resolution
+    step = -(-2 * track.size // max_points)
+    starts = np.arange(0, track.size, step)
+    envelope = np.empty(2 * starts.size, dtype=track.dtype)
+    envelope[0::2] = np.minimum.reduceat(track, starts)
+    envelope[1::2] = np.maximum.reduceat(track, starts)
+    return np.repeat(starts, 2), envelope
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def render_track_png(ref_points, alt_points, ref_base, alt_base):
+    """Plot the reference and alternate mean tracks and return the PNG bytes"""
+    # Create simple plot - just show the raw API data
+    fig, ax1, ax2 = _track_figure()
+    
+    # Plot 1: Reference (exactly as API returns it)
+    ax1.plot(*ref_points, color='blue', label='Reference', linewidth=1)
+    ax1.set_title(f'Reference Allele ({ref_base}) - Raw AlphaGenome Output')
+    ax1.set_ylabel('RNA Expression')
+    ax1.legend()
+    
+    # Plot 2: Alternate (exactly as API returns it)
+    ax2.plot(*alt_points, color='red', label='Alternate', linewidth=1)
+    ax2.set_title(f'Alternate Allele ({alt_base}) - Raw AlphaGenome Output')
+    ax2.set_ylabel('RNA Expression')
+    ax2.set_xlabel('Position Index')
+    ax2.legend()
+    
+    img_buffer = io.BytesIO()
+    # zlib level 3 encodes several times faster than the default 6 for a
+    # slightly larger file; skip the Software metadata chunk as well
+    fig.savefig(img_buffer, format='png', dpi=100,
+                metadata={'Software': None}, pil_kwargs={'compress_level': 3})
+    return img_buffer.getvalue()
+
+def create_visualization(outputs, variant, tissue_name, ref_track, alt_track):
     """Create and display visualization - ONLY AlphaGenome API output"""
     
     try:
-        # Set matplotlib backend for Streamlit
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-        plt.ioff()
-        
         # Extract ONLY what AlphaGenome API returns
         ref_data = outputs.reference.rna_seq.values  # Raw API output
         alt_data = outputs.alternate.rna_seq.values  # Raw API output
         
-        # Create simple plot - just show the raw API data
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-        
-        # Plot 1: Reference (exactly as API returns it)
-        ax1.plot(ref_data.mean(axis=1), color='blue', label='Reference', linewidth=1)
-        ax1.set_title(f'Reference Allele ({variant.reference_bases}) - Raw AlphaGenome Output')
-        ax1.set_ylabel('RNA Expression')
-        ax1.legend()
-        
-        # Plot 2: Alternate (exactly as API returns it)  
-        ax2.plot(alt_data.mean(axis=1), color='red', label='Alternate', linewidth=1)
-        ax2.set_title(f'Alternate Allele ({variant.alternate_bases}) - Raw AlphaGenome Output')
-        ax2.set_ylabel('RNA Expression')
-        ax2.set_xlabel('Position Index')
-        ax2.legend()
-        
-        plt.tight_layout()
+        # Rendered once per track pair; the same PNG is displayed and downloaded
+        png_bytes = render_track_png(
+            decimate_track(ref_track), decimate_track(alt_track),
+            variant.reference_bases, variant.alternate_bases
+        )
         
         # Display in Streamlit
-        st.pyplot(fig)
+        st.image(png_bytes)
         
         # Show raw data info
-        st.markdown('<h3 class="sub-header">📊 Raw AlphaGenome API Output</h3>', unsafe_allow_html=True)
+        st.subheader("📊 Raw AlphaGenome API Output")
         col1, col2 = st.columns(2)
         with col1:
             st.metric("Reference Data Shape", str(ref_data.shape))
@@ -866,19 +687,13 @@ def create_visualization(outputs, variant, tissue_name):
             st.metric("Alternate Data Shape", str(alt_data.shape))
         
         # Download option
-        img_buffer = io.BytesIO()
-        fig.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        
         st.download_button(
             label="📥 Download Plot",
-            data=img_buffer.getvalue(),
+            data=png_bytes,
             file_name=f"alphagenome_raw_{variant.chromosome}_{variant.position}.png",
             mime="image/png"
         )
         
-        plt.close(fig)
-        
     except Exception as e:
         st.error(f"❌ Could not visualize AlphaGenome output: {str(e)}")
         
@@ -893,34 +708,48 @@ API Response Structure:
 - Alternate RNA-seq shape: {outputs.alternate.rna_seq.values.shape if hasattr(outputs, 'alternate') else 'N/A'}
             """)
 
-def create_alphagenome_native_plot(outputs, variant, tissue_name):
+# Underscored arguments are not hashed; the cache is keyed on the variant
+# coordinates, the predicted interval and the tissue the prediction ran for
+@st.cache_data(show_spinner=False, max_entries=32)
+def render_native_png(_outputs, _variant, variant_key, interval_key, tissue_ontology, tissue_name):
+    """Draw AlphaGenome's own track plot and return the PNG bytes"""
+    _configure_matplotlib()
+    from alphagenome.visualization import plot_components
+    import matplotlib.pyplot as plt
+    
+    # Use AlphaGenome's native visualization - exactly as in their docs
+    fig = plot_components.plot(
+        [
+            plot_components.OverlaidTracks(
+                tdata={
+                    'REF': _outputs.reference.rna_seq,
+                    'ALT': _outputs.alternate.rna_seq,
+                },
+                colors={'REF': 'blue', 'ALT': 'red'},
+            ),
+        ],
+        interval=_outputs.reference.rna_seq.interval,
+        annotations=[plot_components.VariantAnnotation([_variant])],
+        title=f'AlphaGenome Native Visualization - {tissue_name}'
+    )
+    
+    img_buffer = io.BytesIO()
+    fig.savefig(img_buffer, format='png', dpi=100,
+                metadata={'Software': None}, pil_kwargs={'compress_level': 3})
+    plt.close(fig)
+    return img_buffer.getvalue()
+
+def create_alphagenome_native_plot(outputs, variant, tissue_name, tissue_ontology):
     """Try AlphaGenome's own visualization if available"""
     try:
-        from alphagenome.visualization import plot_components
-        import matplotlib.pyplot as plt
-        import matplotlib
-        matplotlib.use('Agg')
-        
-        # Use AlphaGenome's native visualization - exactly as in their docs
-        fig = plot_components.plot(
-            [
-                plot_components.OverlaidTracks(
-                    tdata={
-                        'REF': outputs.reference.rna_seq,
-                        'ALT': outputs.alternate.rna_seq,
-                    },
-                    colors={'REF': 'blue', 'ALT': 'red'},
-                ),
-            ],
-            interval=outputs.reference.rna_seq.interval,
-            annotations=[plot_components.VariantAnnotation([variant])],
-            title=f'AlphaGenome Native Visualization - {tissue_name}'
-        )
+        variant_key = (variant.chromosome, variant.position,
+                       variant.reference_bases, variant.alternate_bases)
+        interval_key = str(outputs.reference.rna_seq.interval)
+        png_bytes = render_native_png(outputs, variant, variant_key, interval_key,
+                                      tissue_ontology, tissue_name)
         
         # Display in Streamlit
-        st.pyplot(fig)
-        
-        plt.close(fig)
+        st.image(png_bytes)
         
     except Exception as e:
         st.info(f"AlphaGenome native visualization not available: {str(e)}")
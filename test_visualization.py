@@ -3,9 +3,11 @@
 Test visualization independently
 """
 
+import os
+import sys
 import warnings
-import matplotlib
-matplotlib.use('Agg')  # Set backend before importing pyplot
+# Select the backend through the environment so matplotlib never probes GUI backends
+os.environ['MPLBACKEND'] = 'Agg'
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -28,8 +30,12 @@ def test_basic_visualization():
         ax.legend()
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig('test_plot.png', dpi=150, bbox_inches='tight')
+        # Fixed margins instead of tight_layout/bbox_inches='tight', which both
+        # need an extra draw; the smoke test never inspects pixels, so 72 dpi
+        fig.subplots_adjust(left=0.08, right=0.97, top=0.93, bottom=0.09)
+        # zlib level 3 (instead of 6) and no Software chunk, as in the Streamlit demo
+        plt.savefig('test_plot.png', dpi=72,
+                    metadata={'Software': None}, pil_kwargs={'compress_level': 3})
         plt.close(fig)
         
         print("✅ Basic matplotlib test passed")
@@ -68,6 +74,7 @@ def test_alphagenome_connection():
     
     try:
         from load_env_helper import get_api_key
+        from client_helper import get_model
         from alphagenome.models import dna_client
         
         api_key = get_api_key()
@@ -75,7 +82,7 @@ def test_alphagenome_connection():
             print("❌ No API key found")
             return False
             
-        model = dna_client.create(api_key)
+        model = get_model(api_key)
         print("✅ Model client created")
         
         # Test a simple metadata call
@@ -102,20 +109,24 @@ def main():
     # Test 3: API connection
     connection_ok = test_alphagenome_connection()
     
-    print("\n" + "=" * 50)
-    print("📋 Test Results:")
-    print(f"   Basic Matplotlib: {'✅ PASS' if basic_viz_ok else '❌ FAIL'}")
-    print(f"   AlphaGenome Core: {'✅ PASS' if imports_ok else '❌ FAIL'}")
-    print(f"   Visualization Components: {'✅ PASS' if viz_imports_ok else '❌ FAIL'}")
-    print(f"   API Connection: {'✅ PASS' if connection_ok else '❌ FAIL'}")
+    all_ok = all([basic_viz_ok, imports_ok, connection_ok])
     
-    if all([basic_viz_ok, imports_ok, connection_ok]):
-        print("\n🎉 All tests passed! Streamlit visualization should work.")
-    else:
-        print("\n⚠️ Some tests failed. Check the issues above.")
+    # Emit the whole report with a single write
+    report = [
+        "",
+        "=" * 50,
+        "📋 Test Results:",
+        f"   Basic Matplotlib: {'✅ PASS' if basic_viz_ok else '❌ FAIL'}",
+        f"   AlphaGenome Core: {'✅ PASS' if imports_ok else '❌ FAIL'}",
+        f"   Visualization Components: {'✅ PASS' if viz_imports_ok else '❌ FAIL'}",
+        f"   API Connection: {'✅ PASS' if connection_ok else '❌ FAIL'}",
+        "",
+        "🎉 All tests passed! Streamlit visualization should work." if all_ok
+        else "⚠️ Some tests failed. Check the issues above.",
+    ]
+    sys.stdout.write("\n".join(report) + "\n")
     
-    return all([basic_viz_ok, imports_ok, connection_ok])
+    return all_ok
 
 if __name__ == "__main__":
-    success = main()
-    exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(0 if main() else 1) 
\ No newline at end of file